@@ -15,19 +15,153 @@ Documentation (docstrings and inline comments) is in English.
 Logic preserved as requested.
 """
 import tkinter.font
+import io
 import math
+import time
 import chess
 import tkinter as tk
 from chess import Move
-from typing import Callable, Optional, Tuple, override
-
-
-class DisplayBoard(tk.Frame, chess.Board):
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional, Tuple, override
+
+
+@lru_cache(maxsize=256)
+def _cached_hex(col) -> str:
+    """Memoized (r,g,b) -> '#rrggbb' conversion; col must be hashable."""
+    if isinstance(col, str):
+        return col
+    r, g, b = col
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# Arrow heads are two strokes at +/-35 degrees from the shaft
+_ARROW_COS_B = math.cos(math.radians(35))
+_ARROW_SIN_B = math.sin(math.radians(35))
+
+# SVG element templates used by DisplayBoard.generate_svg
+_SVG_HEADER = '<svg xmlns="http://www.w3.org/2000/svg" width="%s" height="%s">\n'
+_SVG_SQUARE = '<rect x="%s" y="%s" width="%s" height="%s" fill="%s" />\n'
+_SVG_HIGHLIGHT = '<rect x="%s" y="%s" width="%s" height="%s" fill="none" stroke="%s" stroke-width="3"/>\n'
+_SVG_PIECE = '<text x="%s" y="%s" font-size="%s" text-anchor="middle" dominant-baseline="middle">%s</text>\n'
+_SVG_CIRCLE = '<circle cx="%s" cy="%s" r="%s" fill="none" stroke="%s" stroke-width="%s"/>\n'
+_SVG_LINE = '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="%s" stroke-width="%s"/>\n'
+
+# chess.Board methods that change the position in place; DisplayBoard forwards them
+# and then refreshes its position caches and the display
+_BOARD_MUTATORS = frozenset((
+    "set_piece_at", "remove_piece_at", "clear", "clear_board", "reset_board", "set_board_fen",
+    "set_piece_map", "set_castling_fen", "set_chess960_pos", "set_epd", "apply_transform", "apply_mirror",
+))
+# chess.Board state attributes; assigning one on a DisplayBoard writes it through to the board
+_BOARD_FIELDS = frozenset(("castling_rights", "ep_square", "halfmove_clock", "fullmove_number", "chess960"))
+
+# FEN letter of each (color << 3) | piece_type code, None for codes that are not a piece
+_PIECE_CODE_SYMBOLS = tuple(chess.Piece(code & 7, bool(code >> 3)).symbol() if 1 <= code & 7 <= 6 else None
+                            for code in range(16))
+
+
+def _arrow_head(x1, y1, x2, y2, size):
+    """Return (left_x, left_y, right_x, right_y) of an arrow head at (x2, y2).
+
+    Uses the angle-sum identities with the constant head angle, so the shaft
+    direction is the only per-arrow input (no trigonometric calls).
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.hypot(dx, dy)
+    if length:
+        ca, sa = dx / length, dy / length
+    else:
+        ca, sa = 1.0, 0.0
+    cos_minus = ca * _ARROW_COS_B + sa * _ARROW_SIN_B   # cos(angle - b)
+    sin_minus = sa * _ARROW_COS_B - ca * _ARROW_SIN_B   # sin(angle - b)
+    cos_plus = ca * _ARROW_COS_B - sa * _ARROW_SIN_B    # cos(angle + b)
+    sin_plus = sa * _ARROW_COS_B + ca * _ARROW_SIN_B    # sin(angle + b)
+    return (x2 - size * cos_minus, y2 - size * sin_minus,
+            x2 - size * cos_plus, y2 - size * sin_plus)
+
+
+# --------------------
+# Overlay records (row/col are drawing coordinates, row 0 = top rank when not flipped)
+# --------------------
+@dataclass(slots=True, frozen=True)
+class HighlightOverlay:
+    """Square outline highlight."""
+    row: int
+    col: int
+    color: Tuple[int, int, int]
+
+
+@dataclass(slots=True, frozen=True)
+class CircleOverlay:
+    """Circle centered on a square."""
+    row: int
+    col: int
+    color: Tuple[int, int, int]
+    radius: int
+    width: int
+
+
+@dataclass(slots=True, frozen=True)
+class ArrowOverlay:
+    """Arrow between the centers of two squares."""
+    from_row: int
+    from_col: int
+    to_row: int
+    to_col: int
+    color: Tuple[int, int, int]
+    width: int
+
+
+class _VisibleState(NamedTuple):
+    """Everything DisplayBoard.redraw() renders; an unchanged state means nothing to redraw."""
+    board_fen: str
+    selected_square: Optional[int]
+    dragging: bool
+    highlights: tuple
+    circles: tuple
+    arrows: tuple
+    right_click_start: Optional[int]
+    right_click_end: Optional[int]
+    promotion_active: bool
+    flipped: bool
+    square_size: int
+    white_hex: str
+    black_hex: str
+    show_coordinates: bool
+    anim_from: Optional[int] = None  # origin square of the piece being animated
+
+
+@dataclass(slots=True)
+class _AnimState:
+    """Move being animated by an AnimatedDisplayBoard."""
+    move: Move
+    from_square: int
+    to_square: int
+    symbol: str
+    xs: Tuple[int, ...] = ()        # eased x position at each of the evenly spaced frame steps
+    ys: Tuple[int, ...] = ()        # eased y position at each step
+    t0: float = 0.0                 # perf_counter() at animation start
+    item_id: Optional[int] = None   # canvas text item of the moving piece
+
+
+class DisplayBoard(tk.Frame):
     """
     A Tkinter widget that displays and interacts with a chess.Board.
 
+    The position lives in a wrapped chess.Board. Commonly used queries (turn,
+    legal_moves, move_stack, piece_at, piece_map, fen, board_fen, is_legal) and
+    move helpers (push_san, push_uci, push_xboard, reset) are provided directly; any
+    other chess.Board attribute is forwarded to the wrapped board. Forwarded methods
+    that change the position (set_piece_at, clear, set_board_fen, ...) and assigning
+    turn, castling_rights, ep_square, halfmove_clock, fullmove_number or chess960
+    write through to the board and refresh the display. If the wrapped board is
+    changed some other way, call redraw(force=True).
+
     Public methods of interest:
-      - redraw(): redraw the entire board widget.
+      - redraw(force=False): redraw the board widget (skipped if nothing visible changed).
       - set_fen(fen): set position and redraw.
       - on_move(callback): register a callback(move, board) for executed moves.
       - make_move(from_sq, to_sq, promo_piece=None): attempt to make a move (returns Move or None).
@@ -39,6 +173,11 @@ class DisplayBoard(tk.Frame, chess.Board):
         "P": "♙", "N": "♘", "B": "♗", "R": "♖", "Q": "♕", "K": "♔",
         "p": "♟", "n": "♞", "b": "♝", "r": "♜", "q": "♛", "k": "♚"
     }
+    # UNICODE_PIECES indexed by (piece.color << 3) | piece.piece_type
+    UNICODE_TABLE = tuple(map(UNICODE_PIECES.get, _PIECE_CODE_SYMBOLS))
+
+    # (row, col) drawing coordinates of every chess.Square, row 0 being the top rank
+    SQUARE_ROW_COL = tuple((7 - (sq >> 3), sq & 7) for sq in chess.SQUARES)
 
     def __init__(
             self,
@@ -72,7 +211,7 @@ class DisplayBoard(tk.Frame, chess.Board):
         Documentation focuses on usage, not implementation details.
         """
         tk.Frame.__init__(self, master, width=board_size, height=board_size)
-        chess.Board.__init__(self, *args, **kwargs)
+        self._board = chess.Board(*args, **kwargs)
 
         # Canvas setup
         self.master = master
@@ -82,17 +221,42 @@ class DisplayBoard(tk.Frame, chess.Board):
         # Interaction / state flags
         self._promotion_active = False
         self._waiting_move = None
-        self._promotion_buttons = []   # list[(x1,y1,x2,y2), promo]
+        self._promo_bbox = None        # (x0, y0, button_size, gap, promos) of the promotion row
         self._selected_square = None
-        self._right_click_start = None
-        self._right_click_end = None
+        self._right_click_start = None  # chess.Square where the right-drag began
+        self._right_click_end = None    # chess.Square currently under the right-drag pointer
         self._dragging_piece = None
         self._dragging_offset = (0, 0)
-
-        # Collections used for overlay drawing (prevent duplicates)
-        self.highlights = []  # list[(row, col, color)]
-        self.circles = []     # list[(row, col, color, radius, width)]
-        self.arrows = []      # list[(from_row, from_col, to_row, to_col, color, width)]
+        self._board_bg_image = None
+        self._board_bg_key = None
+
+        # Persistent canvas items, updated in place instead of recreated on each redraw
+        self._board_bg_id = None
+        self._piece_items = {}          # chess.Square -> text item of each drawn piece
+        self._board_snapshot = {}       # chess.Square -> symbol those items currently show
+        self._drawn_mask = 0            # bitboard of the squares in _board_snapshot
+        self._piece_layout_key = None   # (flipped, square_size) the piece items were placed for
+        self._coord_layout_key = None   # (shown, flipped, square_size, board_size) of the labels
+        self._promo_layout_key = None   # board_size the promotion chooser items were created for
+        self._promo_shown = False       # whether those items are currently visible
+        self._drag_text_id = None
+        self._last_drag_xy = (0, 0)     # pointer position the drag item was last placed at
+        self._redraw_pending = False
+        self._last_state = None         # visible state of the last redraw
+        self._layer_keys = {}           # overlay layer tag -> state its items were drawn from
+
+        # Position-derived caches, refreshed by _position_changed()
+        self._piece_symbol_cache: list[str | None] = [None] * 64  # Unicode symbol per chess.Square
+        self._occupied_cache = 0        # bitboard of the squares with a piece in _piece_symbol_cache
+        self._legal_by_from: dict[int, list[Move]] | None = None  # legal moves bucketed by from_square
+        self._position_changed()
+
+        # Collections used for overlay drawing (prevent duplicates).
+        # Insertion-ordered dicts used as ordered sets: O(1) membership, add and remove.
+        self.highlights: dict[HighlightOverlay, None] = {}
+        self.circles: dict[CircleOverlay, None] = {}
+        # arrows map to their cached canvas polyline coordinates (None until first drawn)
+        self.arrows: dict[ArrowOverlay, tuple | None] = {}
 
         # Move callbacks - appended via on_move()
         self._move_callbacks = []
@@ -101,12 +265,12 @@ class DisplayBoard(tk.Frame, chess.Board):
 
         # Display / behavior settings
         self.board_size = board_size
+        self._flipped = flipped
         self.square_size = board_size // 8
         self.allow_input = allow_input
         self.allow_dragging = allow_dragging
         self.allow_drawing = allow_drawing
         self.draw_function = draw_function
-        self.flipped = flipped
         self.black_bg = black_bg
         self.white_bg = white_bg
         self.circle_color = circle_color
@@ -137,18 +301,202 @@ class DisplayBoard(tk.Frame, chess.Board):
     # --------------------
     @staticmethod
     def _rgb_to_hex(col):
-        """Convert an (r,g,b) tuple to a hex color string, or return string as-is."""
-        if isinstance(col, str):
-            return col
-        r, g, b = col
-        return f"#{r:02x}{g:02x}{b:02x}"
+        """Convert an (r,g,b) tuple to a hex color string, or return string as-is.
+        Conversions are cached, so each distinct color is formatted only once.
+        """
+        if isinstance(col, list):
+            col = tuple(col)
+        return _cached_hex(col)
+
+    @staticmethod
+    def _color_key(col):
+        """Return the color in hashable form (lists become tuples) for use in overlay keys."""
+        return tuple(col) if isinstance(col, list) else col
+
+    # --------------------
+    # chess.Board access
+    # --------------------
+    def __getattr__(self, name):
+        # Only reached for names the widget itself lacks: forward to the wrapped board.
+        board = self.__dict__.get("_board")
+        if board is None:
+            raise AttributeError(name)
+        attr = getattr(board, name)
+        if name not in _BOARD_MUTATORS:
+            return attr
+
+        def mutate(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            self._board_modified()
+            return result
+        return mutate
+
+    def __setattr__(self, name, value):
+        if name in _BOARD_FIELDS and "_board" in self.__dict__:
+            setattr(self._board, name, value)
+            self._board_modified()
+        else:
+            super().__setattr__(name, value)
+
+    def _board_modified(self):
+        """Refresh caches and display after the wrapped board was changed in place."""
+        self._position_changed()
+        self.redraw()
+
+    @property
+    def turn(self) -> chess.Color:
+        return self._board.turn
+
+    @turn.setter
+    def turn(self, value: chess.Color):
+        self._board.turn = value
+        self._board_modified()
+
+    @property
+    def legal_moves(self) -> chess.LegalMoveGenerator:
+        return self._board.legal_moves
+
+    @property
+    def move_stack(self) -> list[Move]:
+        return self._board.move_stack
+
+    def piece_at(self, square: chess.Square) -> Optional[chess.Piece]:
+        return self._board.piece_at(square)
+
+    def piece_map(self) -> dict[chess.Square, chess.Piece]:
+        return self._board.piece_map()
+
+    def fen(self, **kwargs) -> str:
+        return self._board.fen(**kwargs)
+
+    def board_fen(self, **kwargs) -> str:
+        return self._board.board_fen(**kwargs)
+
+    def is_legal(self, move: Move) -> bool:
+        return self._board.is_legal(move)
+
+    def push_san(self, san: str) -> Move:
+        """Parse a move in SAN, push it (updating the display) and return it."""
+        move = self._board.parse_san(san)
+        self.push(move)
+        return move
+
+    def push_uci(self, uci: str) -> Move:
+        """Parse a move in UCI, push it (updating the display) and return it."""
+        move = self._board.parse_uci(uci)
+        self.push(move)
+        return move
+
+    def push_xboard(self, san: str) -> Move:
+        """Parse a move in XBoard notation, push it (updating the display) and return it."""
+        move = self._board.parse_xboard(san)
+        self.push(move)
+        return move
+
+    def reset(self):
+        """Restore the starting position and update display."""
+        self.set_fen(chess.STARTING_FEN)
+
+    # --------------------
+    # Geometry (pixel tables indexed by drawing row/column)
+    # --------------------
+    @property
+    def square_size(self):
+        return self._square_size
+
+    @square_size.setter
+    def square_size(self, value):
+        self._square_size = value
+        # power-of-two squares let square_at() divide with a shift
+        self._sq_shift = value.bit_length() - 1 if value > 0 and value & (value - 1) == 0 else None
+        self._rebuild_geometry()
+        self._coord_font_size = max(6, value // 5)
+        self._coord_font = tkinter.font.Font(size=self._coord_font_size)
+
+    def _rebuild_geometry(self):
+        """Precompute square edge and center pixel offsets for both orientations."""
+        size = self.square_size
+        half = size // 2
+        self._cell_left = [i * size for i in range(8)]
+        self._cell_center = [i * size + half for i in range(8)]
+        self._cell_left_flipped = self._cell_left[::-1]
+        self._cell_center_flipped = self._cell_center[::-1]
+        # (x, y, is_light) for the 64 squares in row-major drawing order
+        self._square_cells = tuple((x, y, (r + c) % 2 == 0)
+                                   for r, y in enumerate(self._cell_left)
+                                   for c, x in enumerate(self._cell_left))
+        # (cx, cy) pixel center of each chess square, indexed by square
+        self._centers = tuple((self._cell_center[c], self._cell_center[r]) for r, c in self.SQUARE_ROW_COL)
+        self._centers_flipped = tuple((self._cell_center_flipped[c], self._cell_center_flipped[r])
+                                      for r, c in self.SQUARE_ROW_COL)
+        self._select_geometry()
+
+    def _select_geometry(self):
+        """Point the active lookup tables at the current orientation."""
+        if self._flipped:
+            self._left_tab, self._center_tab = self._cell_left_flipped, self._cell_center_flipped
+            self._square_centers = self._centers_flipped
+        else:
+            self._left_tab, self._center_tab = self._cell_left, self._cell_center
+            self._square_centers = self._centers
+        # cached arrow coordinates were computed for the previous geometry
+        for key in self.arrows:
+            self.arrows[key] = None
+
+    @property
+    def flipped(self):
+        return self._flipped
+
+    @flipped.setter
+    def flipped(self, value):
+        self._flipped = value
+        self._select_geometry()
+
+    # --------------------
+    # Colors (hex strings are precomputed on assignment)
+    # --------------------
+    @property
+    def white_bg(self):
+        return self._white_bg
+
+    @white_bg.setter
+    def white_bg(self, value):
+        self._white_bg = value
+        self._white_hex = self._rgb_to_hex(value)
+
+    @property
+    def black_bg(self):
+        return self._black_bg
+
+    @black_bg.setter
+    def black_bg(self, value):
+        self._black_bg = value
+        self._black_hex = self._rgb_to_hex(value)
+
+    @property
+    def arrow_color(self):
+        return self._arrow_color
+
+    @arrow_color.setter
+    def arrow_color(self, value):
+        self._arrow_color = value
+        self._arrow_hex = self._rgb_to_hex(value)
+
+    @property
+    def circle_color(self):
+        return self._circle_color
+
+    @circle_color.setter
+    def circle_color(self, value):
+        self._circle_color = value
+        self._circle_hex = self._rgb_to_hex(value)
 
     @staticmethod
     def row_col_of(square):
         """Return (row, col) used for drawing rectangles from a chess.Square.
         Drawing uses top-left origin where row 0 is top of the canvas.
         """
-        return 7 - chess.square_rank(square), chess.square_file(square)
+        return DisplayBoard.SQUARE_ROW_COL[square]
 
     # --------------------
     # Mouse event handlers
@@ -157,11 +505,12 @@ class DisplayBoard(tk.Frame, chess.Board):
         """
         Left click: handle promotion selection or select/move click flow.
         Dragging is started here if enabled.
+        Every path ends in exactly one redraw (pushing a move redraws as well).
         """
         if self.allow_drawing:
             self.clear_board_draw()
-            self.redraw()
         if not self.allow_input:
+            self.redraw()
             return
 
         x, y = event.x, event.y
@@ -169,16 +518,19 @@ class DisplayBoard(tk.Frame, chess.Board):
         # If promotion dialog active, check which promo button was clicked
         if self._promotion_active:
             self._promotion_active = False
-            for b_bbox, promo in self._promotion_buttons:
-                x1, y1, x2, y2 = b_bbox
-                if x1 <= x <= x2 and y1 <= y <= y2:
-                    if self._waiting_move:
-                        self.make_move(self._waiting_move.from_square, self._waiting_move.to_square, promo)
+            if self._promo_bbox is not None:
+                # buttons are a single row of equally sized squares: hit-test arithmetically
+                bx0, by0, size, gap, promos = self._promo_bbox
+                rel = x - bx0
+                if rel >= 0 and by0 <= y <= by0 + size:
+                    idx, off = divmod(rel, size + gap)
+                    if off <= size and idx < len(promos) and self._waiting_move:
+                        self.make_move(self._waiting_move.from_square, self._waiting_move.to_square, promos[idx])
                         self._waiting_move = None
-                    break
         else:
             square = self.square_at(x, y)
             if square is None:
+                self.redraw()
                 return
 
             # Try to complete a move if a square was previously selected
@@ -187,8 +539,8 @@ class DisplayBoard(tk.Frame, chess.Board):
             else:
                 # Otherwise select piece under cursor if it belongs to side to move
                 self._selected_square = None
-                piece = self.piece_at(square)
-                if piece and piece.color == self.turn:
+                piece = self._board.piece_at(square)
+                if piece and piece.color == self._board.turn:
                     self._selected_square = square
                     # start dragging visualization if allowed
                     if self.allow_dragging:
@@ -197,10 +549,9 @@ class DisplayBoard(tk.Frame, chess.Board):
                         self._dragging_offset = (center_x - event.x, center_y - event.y)
                         self._show_selected()
                         self.redraw()
-                        self.canvas.create_text(event.x + self._dragging_offset[0],
-                                                event.y + self._dragging_offset[1],
-                                                text=self.UNICODE_PIECES[self._dragging_piece.symbol()],
-                                                font=self.font, fill="black")
+                        # the floating piece is a persistent item: shown here, moved by
+                        # _tk_left_motion and hidden again on release
+                        self._show_drag_piece(event.x, event.y)
                         return
 
         self._show_selected()
@@ -210,21 +561,22 @@ class DisplayBoard(tk.Frame, chess.Board):
         """Start right-click annotation (arrow/circle)."""
         if not self.allow_drawing:
             return
-        x, y = event.x, event.y
-        if self.square_at(x, y) is not None:
-            self._right_click_start = x, y
-            self._right_click_end = self._right_click_start
+        square = self.square_at(event.x, event.y)
+        if square is not None:
+            self._right_click_start = square
+            self._right_click_end = square
         self.redraw()
 
     def _tk_right_motion(self, event):
         """Update right-click annotation preview while dragging."""
-        x, y = event.x, event.y
-        if not self._right_click_start:
+        if self._right_click_start is None:
             return
-        end_square = self.square_at(x, y)
-        if end_square is not None:
-            self._right_click_end = x, y
-        self.redraw()
+        # the preview snaps to square centers, so only a change of square needs a redraw
+        end_square = self.square_at(event.x, event.y)
+        if end_square is None or end_square == self._right_click_end:
+            return
+        self._right_click_end = end_square
+        self._schedule_redraw()
 
     def _tk_left_motion(self, event):
         """Show dragging piece while left button is held and dragging is enabled."""
@@ -232,21 +584,18 @@ class DisplayBoard(tk.Frame, chess.Board):
             return
         if not self._dragging_piece:
             return
-        self.redraw()
-        self.canvas.create_text(event.x + self._dragging_offset[0],
-                                event.y + self._dragging_offset[1],
-                                text=self.UNICODE_PIECES[self._dragging_piece.symbol()],
-                                font=self.font, fill="black")
+        last_x, last_y = self._last_drag_xy
+        self.canvas.move(self._drag_text_id, event.x - last_x, event.y - last_y)
+        self._last_drag_xy = (event.x, event.y)
 
     def _tk_right_up(self, event):
         """Complete a right-click annotation: circle (same square) or arrow (different squares)."""
-        x, y = event.x, event.y
-        if self._right_click_start:
-            start_square = self.square_at(*self._right_click_start)
-            end_square = self.square_at(x, y)
-            if start_square is not None and end_square is not None:
-                start_row, start_col = 7 - chess.square_rank(start_square), chess.square_file(start_square)
-                end_row, end_col = 7 - chess.square_rank(end_square), chess.square_file(end_square)
+        start_square = self._right_click_start
+        if start_square is not None:
+            end_square = self.square_at(event.x, event.y)
+            if end_square is not None:
+                start_row, start_col = 7 - (start_square >> 3), start_square & 7
+                end_row, end_col = 7 - (end_square >> 3), end_square & 7
                 if start_square == end_square:
                     self.draw_circle(start_row, start_col, self.circle_color, int(self.square_size / 2.1),
                                      self.circle_width)
@@ -269,62 +618,105 @@ class DisplayBoard(tk.Frame, chess.Board):
             if self.make_move(self._selected_square, to_square):
                 self._selected_square = None
         self._dragging_piece = None
+        self._hide_drag_piece()
         self._show_selected()
-        self.redraw()
+        self._schedule_redraw()
 
     # --------------------
     # Drawing primitives
     # --------------------
-    def _draw_arrow(self, start, end, color=(255, 0, 0), width=2):
-        """Draw an arrow between two canvas pixel coordinates."""
-        color_hex = self._rgb_to_hex(color)
+    def _show_drag_piece(self, x, y):
+        """Show the floating dragged piece at the given pointer position."""
+        if self._drag_text_id is None:
+            self._drag_text_id = self.canvas.create_text(0, 0, font=self.font, fill="black",
+                                                         tags=("persistent", "drag"))
+        self.canvas.itemconfigure(self._drag_text_id, state="normal",
+                                  text=self._piece_glyph(self._dragging_piece))
+        self.canvas.coords(self._drag_text_id, x + self._dragging_offset[0], y + self._dragging_offset[1])
+        self.canvas.tag_raise(self._drag_text_id)
+        self._last_drag_xy = (x, y)
+
+    def _hide_drag_piece(self):
+        """Hide the floating dragged piece (the item is kept for the next drag)."""
+        if self._drag_text_id is not None:
+            self.canvas.itemconfigure(self._drag_text_id, state="hidden")
+
+    def _draw_arrow(self, start, end, color=(255, 0, 0), width=2, tags=()):
+        """Draw an arrow between two canvas pixel coordinates.
+
+        Shaft and both head strokes are emitted as one polyline
+        (start -> tip -> left -> tip -> right), i.e. a single canvas item.
+        """
+        self.canvas.create_line(*self._arrow_polyline(start, end), width=width, fill=self._rgb_to_hex(color),
+                                tags=tags)
+
+    def _arrow_polyline(self, start, end):
+        """Return the flat polyline coordinates of an arrow between two canvas points."""
         x1, y1 = start
         x2, y2 = end
-        self.canvas.create_line(x1, y1, x2, y2, width=width, fill=color_hex)
-        dx = x2 - x1
-        dy = y2 - y1
-        angle = math.atan2(dy, dx)
-        arrow_size = self.square_size / 2
-        arrow_angle = math.radians(35)
-
-        left = (
-            x2 - arrow_size * math.cos(angle - arrow_angle),
-            y2 - arrow_size * math.sin(angle - arrow_angle)
-        )
-        right = (
-            x2 - arrow_size * math.cos(angle + arrow_angle),
-            y2 - arrow_size * math.sin(angle + arrow_angle)
-        )
-        self.canvas.create_line(x2, y2, left[0], left[1], width=width, fill=color_hex)
-        self.canvas.create_line(x2, y2, right[0], right[1], width=width, fill=color_hex)
+        left_x, left_y, right_x, right_y = _arrow_head(x1, y1, x2, y2, self.square_size / 2)
+        return x1, y1, x2, y2, left_x, left_y, x2, y2, right_x, right_y
 
     def _draw_coordinates(self):
-        """Draw board coordinates (a-h and 1-8) around the board."""
-        if not self.show_coordinates:
-            return
-        font_size = max(6, self.square_size // 5)
-        coord_font = tkinter.font.Font(size=font_size)
+        """Draw board coordinates (a-h and 1-8) around the board.
+
+        Labels are persistent items, recreated only when orientation, size or
+        visibility change; redraw() keeps them above the overlays.
+        """
+        layout_key = (self.show_coordinates, self.flipped, self.square_size, self.board_size)
+        if layout_key != self._coord_layout_key:
+            self.canvas.delete("coord")
+            self._coord_layout_key = layout_key
+            if self.show_coordinates:
+                self._create_coordinate_items()
+
+    def _create_coordinate_items(self):
+        """Create the 16 coordinate label items for the current orientation."""
+        font_size = self._coord_font_size
+        coord_font = self._coord_font
         for i in range(8):
             # letters a-h
             letter_index = i if not self.flipped else 7 - i
             letter = chr(ord('a') + letter_index)
-            x = i * self.square_size
+            x = self._cell_left[i]
             y = self.board_size - font_size - 10
-            self.canvas.create_text(x, y, text=letter, anchor="nw", font=coord_font, fill="black")
+            self.canvas.create_text(x, y, text=letter, anchor="nw", font=coord_font, fill="black",
+                                    tags=("persistent", "coord"))
 
             # numbers 1-8
             number_index = 7 - i if not self.flipped else i
             number = str(number_index + 1)
             x = 2
-            y = i * self.square_size + 2
-            self.canvas.create_text(x, y, text=number, anchor="nw", font=coord_font, fill="black")
+            y = self._cell_left[i] + 2
+            self.canvas.create_text(x, y, text=number, anchor="nw", font=coord_font, fill="black",
+                                    tags=("persistent", "coord"))
 
     def _draw_promotion_dialog(self):
-        """Render a simple promotion chooser in the center of the board."""
+        """Show the promotion chooser while a promotion is pending, hide it otherwise.
+
+        Its items are created the first time it is shown (and again only if the
+        board is resized); afterwards they are toggled via their state option.
+        """
+        active = self._promotion_active
+        if self._promo_layout_key != self.board_size:
+            if not active and self._promo_layout_key is None:
+                return
+            self.canvas.delete("promo")
+            self._create_promotion_items()
+            self._promo_layout_key = self.board_size
+            self._promo_shown = False
+        if self._promo_shown != active:
+            self.canvas.itemconfigure("promo", state="normal" if active else "hidden")
+            self._promo_shown = active
+
+    def _create_promotion_items(self):
+        """Create the (hidden) promotion chooser items in the center of the board."""
         w, h = 320, 80
         x = (self.board_size - w) // 2
         y = (self.board_size - h) // 2
-        self.canvas.create_rectangle(x, y, x + w, y + h, outline=self._rgb_to_hex((230, 230, 230)), width=2)
+        tags = ("persistent", "promo")
+        self.canvas.create_rectangle(x, y, x + w, y + h, outline=self._rgb_to_hex((230, 230, 230)), width=2,
+                                     state="hidden", tags=tags)
         options = [
             (chess.QUEEN, "♕"),
             (chess.ROOK, "♖"),
@@ -336,125 +728,253 @@ class DisplayBoard(tk.Frame, chess.Board):
         bx = x + gap
         by = y + (h - size) // 2
 
-        self._promotion_buttons = []
+        self._promo_bbox = (bx, by, size, gap, tuple(promo for promo, _ in options))
         for promo, symbol in options:
             x1 = bx
             y1 = by
             x2 = bx + size
             y2 = by + size
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black", width=1)
+            self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black", width=1,
+                                         state="hidden", tags=tags)
             cx = (x1 + x2) // 2
             cy = (y1 + y2) // 2
-            self.canvas.create_text(cx, cy, text=symbol, font=self.font, fill="black")
-            self._promotion_buttons.append(((x1, y1, x2, y2), promo))
+            self.canvas.create_text(cx, cy, text=symbol, font=self.font, fill="black", state="hidden", tags=tags)
             bx += size + gap
 
     def _draw_temp_arrow_or_circle(self):
         """Draw preview arrow / circle while right-click dragging."""
-        if self._right_click_end and self._right_click_start:
-            start_x, start_y = self._right_click_start
-            end_x, end_y = self._right_click_end
-            start_square = self.square_at(start_x, start_y)
-            end_square = self.square_at(end_x, end_y)
-            if start_square is not None and end_square is not None:
-                start_row, start_col = 7 - chess.square_rank(start_square), chess.square_file(start_square)
-                end_row, end_col = 7 - chess.square_rank(end_square), chess.square_file(end_square)
-                if self.flipped:
-                    start_row, start_col = 7 - start_row, 7 - start_col
-                    end_row, end_col = 7 - end_row, 7 - end_col
-                if start_square == end_square:
-                    center = (start_col * self.square_size + self.square_size // 2,
-                              start_row * self.square_size + self.square_size // 2)
-                    r = int(self.square_size // 2.1)
-                    self.canvas.create_oval(center[0] - r, center[1] - r, center[0] + r, center[1] + r,
-                                            outline=self._rgb_to_hex(self.circle_color), width=self.circle_width)
-                else:
-                    start = (start_col * self.square_size + self.square_size // 2,
-                             start_row * self.square_size + self.square_size // 2)
-                    end = (end_col * self.square_size + self.square_size // 2,
-                           end_row * self.square_size + self.square_size // 2)
-                    self._draw_arrow(start, end, self.arrow_color, self.arrow_width)
+        start_square = self._right_click_start
+        end_square = self._right_click_end
+        if start_square is not None and end_square is not None:
+            start_row, start_col = 7 - (start_square >> 3), start_square & 7
+            end_row, end_col = 7 - (end_square >> 3), end_square & 7
+            center = self._center_tab
+            if start_square == end_square:
+                cx, cy = center[start_col], center[start_row]
+                r = int(self.square_size // 2.1)
+                self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
+                                        outline=self._circle_hex, width=self.circle_width,
+                                        tags=("overlay", "preview"))
+            else:
+                start = (center[start_col], center[start_row])
+                end = (center[end_col], center[end_row])
+                self._draw_arrow(start, end, self._arrow_hex, self.arrow_width, tags=("overlay", "preview"))
+
+    def _build_board_image(self):
+        """Render the 8x8 checkerboard pattern once into a PhotoImage."""
+        size = self.square_size
+        white_hex, black_hex = self._white_hex, self._black_hex
+        image = tk.PhotoImage(master=self.canvas, width=8 * size, height=8 * size)
+        for x1, y1, light in self._square_cells:
+            image.put(white_hex if light else black_hex, to=(x1, y1, x1 + size, y1 + size))
+        return image
 
     def _draw_squares(self):
-        """Draw the 8x8 checkerboard squares."""
-        for r in range(8):
-            for c in range(8):
-                color = self.white_bg if (r + c) % 2 == 0 else self.black_bg
-                x1 = c * self.square_size
-                y1 = r * self.square_size
-                x2 = x1 + self.square_size
-                y2 = y1 + self.square_size
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=self._rgb_to_hex(color), width=0)
+        """Draw the 8x8 checkerboard squares as a single cached image."""
+        # The pattern is symmetric under flipping, so only size and colors invalidate it.
+        key = (self.square_size, self._white_hex, self._black_hex)
+        if self._board_bg_image is None or self._board_bg_key != key:
+            self._board_bg_image = self._build_board_image()
+            self._board_bg_key = key
+            if self._board_bg_id is not None:
+                self.canvas.itemconfigure(self._board_bg_id, image=self._board_bg_image)
+        if self._board_bg_id is None:
+            self._board_bg_id = self.canvas.create_image(0, 0, image=self._board_bg_image, anchor="nw",
+                                                         tags=("persistent", "board"))
 
     def _draw_highlights(self):
         """Draw highlight rectangles stored in self.highlights."""
-        for r, c, color in self.highlights:
-            if self.flipped:
-                r, c = 7 - r, 7 - c
-            x1 = c * self.square_size
-            y1 = r * self.square_size
-            x2 = x1 + self.square_size
-            y2 = y1 + self.square_size
-            self.canvas.create_rectangle(x1, y1, x2, y2, outline=self._rgb_to_hex(color), width=3)
+        left = self._left_tab
+        size = self.square_size
+        for ov in self.highlights:
+            x1 = left[ov.col]
+            y1 = left[ov.row]
+            self.canvas.create_rectangle(x1, y1, x1 + size, y1 + size, outline=self._rgb_to_hex(ov.color), width=3,
+                                         tags=("overlay", "highlight"))
+
+    def _layout_piece_items(self):
+        """Move the piece items onto their squares after a flip or resize."""
+        layout_key = (self.flipped, self.square_size)
+        if self._piece_layout_key == layout_key:
+            return
+        centers = self._square_centers
+        for square, item_id in self._piece_items.items():
+            self.canvas.coords(item_id, *centers[square])
+        self._piece_layout_key = layout_key
+
+    def _sync_piece_items(self, hidden_mask=0, mask=chess.BB_ALL):
+        """Bring the piece items in line with the position, leaving the squares in hidden_mask empty.
+
+        Only squares in the bitboard mask are compared.
+        """
+        canvas = self.canvas
+        items = self._piece_items
+        snapshot = self._board_snapshot
+        symbols = self._piece_symbol_cache
+        shown = self._occupied_cache & mask & ~hidden_mask
+        drawn = self._drawn_mask & mask
+
+        # squares that keep a piece only need their symbol checked
+        for square in chess.scan_reversed(shown & drawn):
+            symbol = symbols[square]
+            if snapshot[square] != symbol:
+                canvas.itemconfigure(items[square], text=symbol)
+                snapshot[square] = symbol
+        added_mask = shown & ~drawn
+        removed_mask = drawn & ~shown
+        if not added_mask and not removed_mask:
+            return
+        self._drawn_mask = (self._drawn_mask | added_mask) & ~removed_mask
+
+        # a moved piece reuses the item of the square it left
+        removed = list(chess.scan_reversed(removed_mask))
+        centers = self._square_centers
+        for square in chess.scan_reversed(added_mask):
+            symbol = symbols[square]
+            if removed:
+                old_square = removed.pop()
+                del snapshot[old_square]
+                item_id = items.pop(old_square)
+                canvas.coords(item_id, *centers[square])
+                canvas.itemconfigure(item_id, text=symbol)
+            else:
+                item_id = canvas.create_text(*centers[square], text=symbol, font=self.font, fill="black",
+                                             tags=("persistent", "piece"))
+            items[square] = item_id
+            snapshot[square] = symbol
+        for square in removed:
+            del snapshot[square]
+            canvas.delete(items.pop(square))
+
+    def _position_changed(self):
+        """Invalidate caches derived from the position after the board changed."""
+        self._rebuild_piece_cache()
+        self._legal_by_from = None
+
+    def _get_legal_by_from(self) -> dict[int, list[Move]]:
+        """Return legal moves grouped by origin square, generated once per position."""
+        if self._legal_by_from is None:
+            buckets = defaultdict(list)
+            for move in self._board.legal_moves:
+                buckets[move.from_square].append(move)
+            self._legal_by_from = buckets
+        return self._legal_by_from
+
+    def _piece_glyph(self, piece: chess.Piece) -> str:
+        """Return the Unicode symbol of a piece."""
+        return self.UNICODE_TABLE[(piece.color << 3) | piece.piece_type]
+
+    def _rebuild_piece_cache(self):
+        """Refresh the per-square Unicode symbol cache and board FEN from the current position."""
+        cache = [None] * 64
+        table = self.UNICODE_TABLE
+        for square, piece in self._board.piece_map().items():
+            cache[square] = table[(piece.color << 3) | piece.piece_type]
+        self._piece_symbol_cache = cache
+        self._occupied_cache = self._board.occupied
+        self._board_fen_cache = self._board.board_fen()
+
+    def _hidden_mask(self) -> chess.Bitboard:
+        """Return the bitboard of squares whose piece is drawn elsewhere (the dragged piece's origin)."""
+        if self._dragging_piece is not None and self._selected_square is not None:
+            return chess.BB_SQUARES[self._selected_square]
+        return chess.BB_EMPTY
 
     def _draw_pieces(self):
         """Draw all pieces on the board using Unicode symbols."""
-        for r in range(8):
-            for c in range(8):
-                square = chess.square(c, 7 - r)
-                piece = self.piece_at(square)
-                # skip drawing the piece currently being dragged at its origin square
-                if piece == self._dragging_piece and square == self._selected_square:
-                    continue
-                if piece:
-                    symbol = DisplayBoard.UNICODE_PIECES[piece.symbol()]
-                    draw_r, draw_c = r, c
-                    if self.flipped:
-                        draw_r, draw_c = 7 - r, 7 - c
-                    x_center = draw_c * self.square_size + self.square_size // 2
-                    y_center = draw_r * self.square_size + self.square_size // 2
-                    self.canvas.create_text(x_center, y_center, text=symbol, font=self.font, fill="black")
+        self._layout_piece_items()
+        self._sync_piece_items(self._hidden_mask())
 
     def _draw_circles(self):
         """Draw circles from self.circles."""
-        for r, c, color, radius, width in self.circles:
-            rr, cc = r, c
-            if self.flipped:
-                rr, cc = 7 - r, 7 - c
-            center_x = cc * self.square_size + self.square_size / 2
-            center_y = rr * self.square_size + self.square_size / 2
+        center = self._center_tab
+        for ov in self.circles:
+            center_x = center[ov.col]
+            center_y = center[ov.row]
+            radius = ov.radius
             self.canvas.create_oval(center_x - radius, center_y - radius,
                                     center_x + radius, center_y + radius,
-                                    outline=self._rgb_to_hex(color), width=width)
+                                    outline=self._rgb_to_hex(ov.color), width=ov.width,
+                                    tags=("overlay", "circle"))
 
     def _draw_arrows(self):
-        """Draw stored arrows from self.arrows."""
-        for fr, fc, tr, tc, color, width in self.arrows:
-            fr2, fc2, tr2, tc2 = fr, fc, tr, tc
-            if self.flipped:
-                fr2, fc2 = 7 - fr, 7 - fc
-                tr2, tc2 = 7 - tr, 7 - tc
-            start = (fc2 * self.square_size + self.square_size // 2,
-                     fr2 * self.square_size + self.square_size // 2)
-            end = (tc2 * self.square_size + self.square_size // 2,
-                   tr2 * self.square_size + self.square_size // 2)
-            self._draw_arrow(start, end, color=color, width=width)
-
-    def redraw(self):
-        """Clear canvas and redraw the entire board, overlays and optional custom drawing."""
-        self.canvas.delete("all")
+        """Draw stored arrows from self.arrows, computing their geometry only once."""
+        center = self._center_tab
+        arrows = self.arrows
+        for ov, coords in arrows.items():
+            if coords is None:
+                coords = arrows[ov] = self._arrow_polyline((center[ov.from_col], center[ov.from_row]),
+                                                           (center[ov.to_col], center[ov.to_row]))
+            self.canvas.create_line(*coords, width=ov.width, fill=self._rgb_to_hex(ov.color),
+                                    tags=("overlay", "arrow"))
+
+    def _schedule_redraw(self):
+        """Request a redraw on the next idle cycle; repeated requests are coalesced."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Idle callback for _schedule_redraw()."""
+        self._redraw_pending = False
+        self.redraw()
+
+    def _visible_state(self) -> _VisibleState:
+        """Return a hashable snapshot of everything redraw() renders."""
+        return _VisibleState(self._board_fen_cache, self._selected_square, self._dragging_piece is not None,
+                             tuple(self.highlights), tuple(self.circles), tuple(self.arrows),
+                             self._right_click_start, self._right_click_end, self._promotion_active, self.flipped,
+                             self.square_size, self._white_hex, self._black_hex, self.show_coordinates)
+
+    # stacking order of the canvas layers, bottom to top
+    LAYER_ORDER = ("board", "highlight", "piece", "preview", "circle", "arrow", "coord", "promo", "drag")
+
+    def _refresh_layer(self, tag, key, draw):
+        """Recreate the items of an overlay layer if the state it is drawn from changed."""
+        if self._layer_keys.get(tag) != key:
+            self.canvas.delete(tag)
+            self._layer_keys[tag] = key
+            draw()
+
+    def redraw(self, force: bool = False):
+        """Redraw the board, overlays and optional custom drawing.
+
+        Board and piece items persist between redraws and are only updated where the
+        state changed, and the promotion dialog is only shown or hidden. Each overlay
+        layer (highlights, preview, circles, arrows) is tagged separately and recreated
+        only when its own state changed; custom drawing is always recreated.
+
+        The redraw is skipped when the visible state is unchanged since the last one,
+        unless force is True or a draw_function is installed. force=True also re-reads
+        the position from the wrapped board, e.g. after it was modified directly.
+        """
+        if force:
+            self._position_changed()
+        state = self._visible_state()
+        if state == self._last_state and not force and not self.draw_function:
+            return
+        self._last_state = state
+        if force:
+            self._layer_keys.clear()
+        # untagged items come from draw_function
+        self.canvas.delete("!persistent&&!overlay")
         self._draw_squares()
-        self._draw_highlights()
+        flipped, size = self.flipped, self.square_size
+        self._refresh_layer("highlight", (tuple(self.highlights), flipped, size), self._draw_highlights)
         self._draw_pieces()
-        self._draw_temp_arrow_or_circle()
-        self._draw_circles()
-        self._draw_arrows()
+        self._refresh_layer("preview", (self._right_click_start, self._right_click_end, flipped, size,
+                                        self._arrow_hex, self.arrow_width, self._circle_hex, self.circle_width),
+                            self._draw_temp_arrow_or_circle)
+        self._refresh_layer("circle", (tuple(self.circles), flipped, size), self._draw_circles)
+        self._refresh_layer("arrow", (tuple(self.arrows), flipped, size), self._draw_arrows)
         self._draw_coordinates()
-        if self._promotion_active:
-            self._draw_promotion_dialog()
+        self._draw_promotion_dialog()
+        for tag in self.LAYER_ORDER:
+            self.canvas.tag_raise(tag)
         if self.draw_function:
             # Optional user-supplied drawing hook: draw_function(self)
             self.draw_function(self)
+            self.canvas.tag_raise("drag")
 
     # --------------------
     # Selection / legal move visualization
@@ -465,22 +985,21 @@ class DisplayBoard(tk.Frame, chess.Board):
             return
         self.highlight_square(self._selected_square, self.highlight_color, False)
         if self.show_legal:
-            for move in self.legal_moves:
-                if move.from_square == self._selected_square:
-                    to_sq = move.to_square
-                    r, c = 7 - chess.square_rank(to_sq), chess.square_file(to_sq)
-                    self.draw_circle(r, c, self.legal_moves_circles_color, self.legal_moves_circles_radius,
-                                     self.legal_moves_circles_width, False)
+            for move in self._get_legal_by_from().get(self._selected_square, ()):
+                to_sq = move.to_square
+                r, c = 7 - (to_sq >> 3), to_sq & 7
+                self.draw_circle(r, c, self.legal_moves_circles_color, self.legal_moves_circles_radius,
+                                 self.legal_moves_circles_width, False)
 
     # --------------------
     # Game logic integration
     # --------------------
     def _is_promotion(self, from_square, to_square) -> bool:
         """Return True if the move is a pawn promotion (destination rank for pawn)."""
-        piece = self.piece_at(from_square)
+        piece = self._board.piece_at(from_square)
         if not piece or piece.piece_type != chess.PAWN:
             return False
-        rank_to = chess.square_rank(to_square)
+        rank_to = to_square >> 3
         if (piece.color == chess.WHITE and rank_to == 7) or (piece.color == chess.BLACK and rank_to == 0):
             return True
         return False
@@ -488,27 +1007,29 @@ class DisplayBoard(tk.Frame, chess.Board):
     def clear_board_draw(self, highlights: bool = True, circles: bool = True, arrows: bool = True):
         """Clear overlay lists selectively."""
         if highlights:
-            self.highlights = []
+            self.highlights.clear()
         if arrows:
-            self.arrows = []
+            self.arrows.clear()
         if circles:
-            self.circles = []
+            self.circles.clear()
 
     def push(self, move: Move) -> None:
         """Push a move to the underlying chess.Board and update display."""
-        super().push(move)
+        self._board.push(move)
+        self._position_changed()
         self.redraw()
 
     def pop(self) -> Move:
         """Pop last move from the board, clear overlays and update display."""
         self.clear_board_draw()
-        move = super().pop()
+        move = self._board.pop()
+        self._position_changed()
         self.redraw()
         return move
 
     def clone_board(self) -> chess.Board:
         """Return a detached copy of the current board (chess.Board object)."""
-        board_copy = chess.Board(fen=self.fen())
+        board_copy = chess.Board(fen=self._board.fen())
         return board_copy
 
     def make_move(self, from_square, to_square, promo_piece=None, callback: bool = True) -> Optional[chess.Move]:
@@ -522,12 +1043,13 @@ class DisplayBoard(tk.Frame, chess.Board):
         if from_square is None or to_square is None:
             return None
         # If promotion needed and promotion not yet chosen, set waiting move and show dialog
-        if promo_piece is None and self._is_promotion(from_square, to_square) and chess.Move(from_square, to_square, chess.QUEEN) in self.legal_moves:
+        candidates = self._get_legal_by_from().get(from_square, ())
+        if promo_piece is None and self._is_promotion(from_square, to_square) and chess.Move(from_square, to_square, chess.QUEEN) in candidates:
             self._waiting_move = chess.Move(from_square, to_square)
             self._promotion_active = True
             return None
         move = chess.Move(from_square, to_square, promotion=promo_piece)
-        if move in self.legal_moves:
+        if move in candidates:
             self.push(move)
             if callback:
                 for cb in self._move_callbacks:
@@ -543,11 +1065,16 @@ class DisplayBoard(tk.Frame, chess.Board):
         """
         if x < 0 or y < 0 or x >= self.board_size or y >= self.board_size:
             return None
-        col = int(x // self.square_size)
-        row = int(y // self.square_size)
+        shift = self._sq_shift
+        if shift is not None:
+            col = int(x) >> shift
+            row = int(y) >> shift
+        else:
+            col = int(x // self.square_size)
+            row = int(y // self.square_size)
         if self.flipped:
             col, row = 7 - col, 7 - row
-        return chess.square(col, 7 - row)
+        return ((7 - row) << 3) + col
 
     def on_move(self, callback: Callable[[chess.Move, "DisplayBoard"], None]):
         """Register a callback(move, board) called after each executed move."""
@@ -558,14 +1085,7 @@ class DisplayBoard(tk.Frame, chess.Board):
         Return the canvas pixel coordinates of the center of the given square.
         Handles flipped orientation.
         """
-        col = chess.square_file(square)
-        row = chess.square_rank(square)
-        if self.flipped:
-            col = 7 - col
-            row = 7 - row
-        center_x = col * self.square_size + self.square_size // 2
-        center_y = (7 - row) * self.square_size + self.square_size // 2
-        return center_x, center_y
+        return self._square_centers[square]
 
     def flip_board(self):
         """Toggle board orientation and redraw."""
@@ -581,131 +1101,113 @@ class DisplayBoard(tk.Frame, chess.Board):
         Avoids duplicate highlights; if delete=True and the highlight exists it will be removed.
         """
         row, col = self.row_col_of(square)
-        item = (row, col, color)
+        item = HighlightOverlay(row, col, self._color_key(color))
         if item not in self.highlights:
-            self.highlights.append(item)
+            self.highlights[item] = None
         elif delete:
-            try:
-                self.highlights.remove(item)
-            except ValueError:
-                pass
+            del self.highlights[item]
 
     def draw_circle(self, row: int, col: int, color, radius: int, width: int, delete: bool = True):
         """Add/remove a circle overlay at the specified row/col (drawing coordinates)."""
-        item = (row, col, color, radius, width)
+        item = CircleOverlay(row, col, self._color_key(color), radius, width)
         if item not in self.circles:
-            self.circles.append(item)
+            self.circles[item] = None
         elif delete:
-            try:
-                self.circles.remove(item)
-            except ValueError:
-                pass
+            del self.circles[item]
 
     def draw_arrow(self, from_row: int, from_col: int, to_row: int, to_col: int, color, width: int, delete: bool = True):
         """Add/remove an arrow overlay defined by start/end square grid coordinates."""
-        item = (from_row, from_col, to_row, to_col, color, width)
+        item = ArrowOverlay(from_row, from_col, to_row, to_col, self._color_key(color), width)
         if item not in self.arrows:
-            self.arrows.append(item)
+            self.arrows[item] = None
         elif delete:
-            try:
-                self.arrows.remove(item)
-            except ValueError:
-                pass
+            del self.arrows[item]
 
     def set_fen(self, fen: str):
         """Set position by FEN and refresh overlays and display."""
-        super().set_fen(fen)
+        self._board.set_fen(fen)
+        self._position_changed()
         self.clear_board_draw()
         self._selected_square = None
         self.redraw()
 
     def generate_svg(self,highlights:bool=True,circles:bool=True,arrows:bool=True) -> str:
         """Draw the board as SVG."""
+        buf = io.StringIO()
+        self._write_svg(buf.write, highlights, circles, arrows)
+        return buf.getvalue()
+
+    def _write_svg(self, append: Callable[[str], object], highlights: bool, circles: bool, arrows: bool):
+        """Emit the SVG document fragment by fragment through append (e.g. a file's write)."""
         square_size = self.square_size
         board_size = self.board_size
-        svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="{board_size}" height="{board_size}">\n'
-
+        flipped = self.flipped
+        append(_SVG_HEADER % (board_size, board_size))
 
-        # Draw squares
-        for r in range(8):
-            for c in range(8):
-                color = self.white_bg if (r + c) % 2 == 0 else self.black_bg
-                rr, cc = (7 - r, 7 - c) if self.flipped else (r, c)
-                x = cc * square_size
-                y = rr * square_size
-                hex_color = self._rgb_to_hex(color)
-                svg+=f'<rect x="{x}" y="{y}" width="{square_size}" height="{square_size}" fill="{hex_color}" />\n'
+        # Draw squares (the pattern is flip-symmetric; reversing only keeps element order)
+        white_hex, black_hex = self._white_hex, self._black_hex
+        cells = reversed(self._square_cells) if flipped else self._square_cells
+        for x, y, light in cells:
+            hex_color = white_hex if light else black_hex
+            append(_SVG_SQUARE % (x, y, square_size, square_size, hex_color))
 
         if highlights:
             # Draw highlights
-            for r, c, color in self.highlights:
-                rr, cc = (7 - r, 7 - c) if self.flipped else (r, c)
+            for ov in self.highlights:
+                rr, cc = (7 - ov.row, 7 - ov.col) if flipped else (ov.row, ov.col)
                 x = cc * square_size
                 y = rr * square_size
-                hex_color = self._rgb_to_hex(color)
-                svg+=f'<rect x="{x}" y="{y}" width="{square_size}" height="{square_size}" fill="none" stroke="{hex_color}" stroke-width="3"/>\n'
+                hex_color = self._rgb_to_hex(ov.color)
+                append(_SVG_HIGHLIGHT % (x, y, square_size, square_size, hex_color))
 
         # Draw pieces (as text)
         font_size = int(square_size * 0.7)
         for r in range(8):
             for c in range(8):
                 square = chess.square(c, 7 - r)
-                piece = self.piece_at(square)
+                piece = self._board.piece_at(square)
                 if piece:
-                    rr, cc = (7 - r, 7 - c) if self.flipped else (r, c)
+                    rr, cc = (7 - r, 7 - c) if flipped else (r, c)
                     cx = cc * square_size + square_size / 2
                     cy = rr * square_size + square_size / 2
-                    symbol = self.UNICODE_PIECES[piece.symbol()]
-                    svg+=f'<text x="{cx}" y="{cy}" font-size="{font_size}" text-anchor="middle" dominant-baseline="middle">{symbol}</text>\n'
+                    symbol = self._piece_glyph(piece)
+                    append(_SVG_PIECE % (cx, cy, font_size, symbol))
 
         if circles:
             # Draw circles
-            for r, c, color, radius, width in self.circles:
-                rr, cc = (7 - r, 7 - c) if self.flipped else (r, c)
+            for ov in self.circles:
+                rr, cc = (7 - ov.row, 7 - ov.col) if flipped else (ov.row, ov.col)
                 cx = cc * square_size + square_size / 2
                 cy = rr * square_size + square_size / 2
-                hex_color = self._rgb_to_hex(color)
-                svg+=f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="none" stroke="{hex_color}" stroke-width="{width}"/>\n'
+                hex_color = self._rgb_to_hex(ov.color)
+                append(_SVG_CIRCLE % (cx, cy, ov.radius, hex_color, ov.width))
 
         if arrows:
             # Draw arrows
-            for fr, fc, tr, tc, color, width in self.arrows:
-                fr, fc = (7 - fr, 7 - fc) if self.flipped else (fr, fc)
-                tr, tc = (7 - tr, 7 - tc) if self.flipped else (tr, tc)
+            arrow_size = square_size / 2
+            for ov in self.arrows:
+                fr, fc, tr, tc = ov.from_row, ov.from_col, ov.to_row, ov.to_col
+                fr, fc = (7 - fr, 7 - fc) if flipped else (fr, fc)
+                tr, tc = (7 - tr, 7 - tc) if flipped else (tr, tc)
+                width = ov.width
                 x1 = fc * square_size + square_size / 2
                 y1 = fr * square_size + square_size / 2
                 x2 = tc * square_size + square_size / 2
                 y2 = tr * square_size + square_size / 2
-                hex_color = self._rgb_to_hex(color)
-                dx = x2 - x1
-                dy = y2 - y1
-                angle = math.atan2(dy, dx)
-                arrow_size = self.square_size / 2
-                arrow_angle = math.radians(35)
-
-                left = (
-                    x2 - arrow_size * math.cos(angle - arrow_angle),
-                    y2 - arrow_size * math.sin(angle - arrow_angle)
-                )
-                right = (
-                    x2 - arrow_size * math.cos(angle + arrow_angle),
-                    y2 - arrow_size * math.sin(angle + arrow_angle)
-                )
-
-                svg+=(
-                    f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{hex_color}" stroke-width="{width}"/>\n'
-                    f'<line x1="{x2}" y1="{y2}" x2="{left[0]}" y2="{left[1]}" stroke="{hex_color}" stroke-width="{width}"/>\n'
-                    f'<line x1="{x2}" y1="{y2}" x2="{right[0]}" y2="{right[1]}" stroke="{hex_color}" stroke-width="{width}"/>\n'
-                )
-
-        svg+="</svg>"
-        return svg
+                hex_color = self._rgb_to_hex(ov.color)
+                left_x, left_y, right_x, right_y = _arrow_head(x1, y1, x2, y2, arrow_size)
+
+                append(_SVG_LINE % (x1, y1, x2, y2, hex_color, width))
+                append(_SVG_LINE % (x2, y2, left_x, left_y, hex_color, width))
+                append(_SVG_LINE % (x2, y2, right_x, right_y, hex_color, width))
+
+        append("</svg>")
 
     def export_svg(self, path: str,highlights:bool=True,circles:bool=True,arrows:bool=True) -> bool:
             """Export the board as SVG."""
             try:
                 with open(path, 'w', encoding='utf-8') as f:
-                    f.write(self.generate_svg(highlights, circles, arrows))
+                    self._write_svg(f.write, highlights, circles, arrows)
                 return True
             except OSError:
                 return False
@@ -716,12 +1218,13 @@ class DisplayBoard(tk.Frame, chess.Board):
         self.allow_drawing = not value
         self._dragging_offset = (0,0)
         self._dragging_piece = None
+        self._hide_drag_piece()
         self._promotion_active = False
         self._waiting_move = None
-        self.redraw()
+        self._schedule_redraw()
 
 class AnimatedDisplayBoard(DisplayBoard):
-    """DisplayBoard with smooth small animations. New animation kills previous one."""
+    """DisplayBoard with smooth small animations. Moves pushed during an animation are queued and played in order."""
 
     def __init__(self, *args,
                  animation_fps: int = 60,
@@ -735,8 +1238,12 @@ class AnimatedDisplayBoard(DisplayBoard):
         self.allow_animation = bool(allow_animation)
 
         self._animating: bool = False
-        self._anim_after_id  = None
-        self._anim_data = None
+        self._anim_after_id  = None     # pending tick of the animation loop, if armed
+        self._tick_command = None       # Tcl name of _animate_step, registered on first use
+        self._anim_data: Optional[_AnimState] = None
+        self._move_queue: deque[chess.Move] = deque()  # pushes waiting for the current animation
+        self._dirty_squares = chess.BB_EMPTY  # bitboard of squares awaiting repaint
+        self._dirty_flush_pending = False
 
         # derived interval (ms)
         self._anim_frame_interval_ms = int(1000 / max(1, self.animation_fps))
@@ -760,42 +1267,94 @@ class AnimatedDisplayBoard(DisplayBoard):
     # Animation control
     # --------------------
     def stop_animation(self):
-        """Immediately stop current animation and, if an anim move exists, execute it."""
-        # cancel scheduled callback
-        if self._anim_after_id:
-            try:
-                self.after_cancel(self._anim_after_id)
-            except Exception:
-                pass
-            self._anim_after_id = None
+        """Immediately stop current animation and execute its move and any queued ones."""
+        # stop anim state and disarm the pending tick;
+        # clear anim data before committing (avoid re-entry issues)
+        self._animating = False
+        self._cancel_tick()
+        state = self._anim_data
+        self._anim_data = None
+
+        # if there is an in-progress animation, commit its move now
+        if state is not None:
+            self._delete_anim_item(state)
+            self._commit_move(state.move)
+        queue = self._move_queue
+        while queue:
+            self._commit_move(queue.popleft())
 
-        # stop anim state
+    def _discard_animation(self):
+        """Drop the current animation and the queued moves without committing them."""
         self._animating = False
+        self._cancel_tick()
+        state = self._anim_data
+        self._anim_data = None
+        if state is not None:
+            self._delete_anim_item(state)
+        self._move_queue.clear()
 
-        # if there is an in-progress animation and it contained a move, commit it now
-        if self._anim_data and "move" in self._anim_data:
-            move = self._anim_data.get("move")
-            # clear anim data before committing (avoid re-entry issues)
-            self._anim_data = None
-            try:
-                # call DisplayBoard.push to bypass our override and avoid recursion
-                DisplayBoard.push(self, move)
-            except Exception:
-                # as fallback try super().push
-                try:
-                    super().push(move)
-                except Exception:
-                    pass
-
-        # redraw to clear any animated overlays
+    def _cancel_tick(self):
+        """Cancel the armed tick of the animation loop, if any."""
+        if self._anim_after_id is None:
+            return
         try:
-            self.redraw()
-        except Exception:
+            self.tk.call("after", "cancel", self._anim_after_id)
+        except tk.TclError:
             pass
+        self._anim_after_id = None
+
+    def _commit_move(self, move: chess.Move):
+        """Push an animated move onto the board without animating it again; the squares it changed are repainted on idle."""
+        self._board.push(move)
+        self._position_changed()
+        snapshot = self._board_snapshot
+        changed = chess.BB_EMPTY
+        for square, symbol in enumerate(self._piece_symbol_cache):
+            if symbol != snapshot.get(square):
+                changed |= chess.BB_SQUARES[square]
+        self._invalidate(changed)
+
+    # --------------------
+    # Dirty squares
+    # --------------------
+    def _invalidate(self, squares: chess.Bitboard):
+        """Mark squares for repainting; all squares marked before idle are flushed together."""
+        self._dirty_squares |= squares
+        if not self._dirty_flush_pending:
+            self._dirty_flush_pending = True
+            self.after_idle(self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Repaint the pieces on the dirty squares, or the whole board if that is cheaper or required."""
+        self._dirty_flush_pending = False
+        mask = self._dirty_squares
+        self._dirty_squares = chess.BB_EMPTY
+        if not mask:
+            return
+        state = self._visible_state()
+        last = self._last_state
+        # the partial path only repaints pieces, so nothing but the position and
+        # the animated origin square may have changed since the last redraw
+        if (self.draw_function or last is None
+                or state._replace(board_fen="", anim_from=None) != last._replace(board_fen="", anim_from=None)
+                or chess.popcount(mask) * 2 > 64):
+            self.redraw()
+            return
+        for anim_from in (state.anim_from, last.anim_from):
+            if anim_from is not None:
+                mask |= chess.BB_SQUARES[anim_from]
+        self._sync_piece_items(self._hidden_mask(), mask=mask)
+        # pieces created by the sync land on top: restack the layers above them
+        canvas = self.canvas
+        for tag in self.LAYER_ORDER[self.LAYER_ORDER.index("piece") + 1:]:
+            canvas.tag_raise(tag)
+        if state.anim_from is not None and self._anim_data.item_id is not None:
+            canvas.tag_raise(self._anim_data.item_id)
+        self._last_state = state
 
     def _start_move_animation(self, move: chess.Move):
-        """Start animating the given move (cancels any previous animation)."""
-        # cancel any existing animation and commit its move first (stop_animation)
+        """Start animating the given move; callers queue moves while another animation runs."""
+        # defensive: commit any animation still running (and the queue) first
         if self._animating:
             self.stop_animation()
 
@@ -812,149 +1371,136 @@ class AnimatedDisplayBoard(DisplayBoard):
         from_sq = move.from_square
         to_sq = move.to_square
 
-        piece = self.piece_at(from_sq)
+        piece = self._board.piece_at(from_sq)
         if piece is None:
             # nothing to animate; just perform the push
             DisplayBoard.push(self, move)
             return
 
+        # below one pixel per frame the motion is invisible; just perform the push
+        cx_from, cy_from = self._square_centers[from_sq]
+        cx_to, cy_to = self._square_centers[to_sq]
         frames = self._frames_for_duration()
-        self._anim_data = {
-            "move": move,
-            "from_square": from_sq,
-            "to_square": to_sq,
-            "piece_symbol": self.UNICODE_PIECES[piece.symbol()],
-            "frames": frames,
-            "frame": 0,
-        }
+        if max(abs(cx_to - cx_from), abs(cy_to - cy_from)) < frames:
+            DisplayBoard.push(self, move)
+            return
+
+        # the whole eased path is known up front; ticks only look positions up
+        eased = [self._ease_out_quad(i / frames) for i in range(frames + 1)]
+        state = _AnimState(move, from_sq, to_sq, self._piece_glyph(piece),
+                           tuple(int(cx_from + (cx_to - cx_from) * e) for e in eased),
+                           tuple(int(cy_from + (cy_to - cy_from) * e) for e in eased))
+        self._anim_data = state
         self._animating = True
         # recalc interval in case fps changed
         self._anim_frame_interval_ms = int(1000 / max(1, self.animation_fps))
+        # one redraw hides the piece on its origin square; frames then only move its text item
+        self.redraw()
+        state.item_id = self.canvas.create_text(cx_from, cy_from, text=state.symbol, font=self.font,
+                                                fill="black", tags=("persistent", "anim"))
+        # progress is measured from here, independent of how often frames actually fire
+        state.t0 = time.perf_counter()
         # schedule first frame
         self._schedule_next_frame()
 
-    def _schedule_next_frame(self):
-        if not self._animating or self._anim_data is None:
+    def _delete_anim_item(self, state: _AnimState):
+        """Remove the moving piece item of an animation, if any."""
+        if state.item_id is not None:
+            self.canvas.delete(state.item_id)
+            state.item_id = None
+
+    def _schedule_next_frame(self, delay_ms: Optional[int] = None):
+        """Arm the animation loop's next tick, unless one is already pending."""
+        if not self._animating or self._anim_data is None or self._anim_after_id is not None:
             return
-        # ensure previous after id cleared
-        if self._anim_after_id:
-            try:
-                self.after_cancel(self._anim_after_id)
-            except Exception:
-                pass
-            self._anim_after_id = None
-        self._anim_after_id = self.after(self._anim_frame_interval_ms, self._animate_step)
+        if delay_ms is None:
+            delay_ms = self._anim_frame_interval_ms
+        if self._tick_command is None:
+            # registered once and re-armed each tick, instead of after() creating a Tcl command per frame
+            self._tick_command = self.register(self._animate_step)
+        self._anim_after_id = self.tk.call("after", delay_ms, self._tick_command)
 
     def _animate_step(self):
         """One animation tick; commit move when finished."""
         self._anim_after_id = None
-        if not self._animating or self._anim_data is None:
+        state = self._anim_data
+        if not self._animating or state is None:
             return
 
-        self._anim_data["frame"] += 1
-        frame = self._anim_data["frame"]
-        frames = self._anim_data["frames"]
-
-        # redraw shows the current animated position
-        try:
-            self.redraw()
-        except Exception:
-            pass
-
-        if frame < frames:
-            # continue animation
-            self._schedule_next_frame()
+        # wall-clock progress, so late or dropped ticks do not stretch the animation
+        now = time.perf_counter()
+        duration = self.animation_duration
+        t = min(1.0, (now - state.t0) / duration) if duration > 0 else 1.0
+
+        if t < 1.0:
+            # only the moving piece changes between frames
+            step = int(t * (len(state.xs) - 1) + 0.5)
+            self.canvas.coords(state.item_id, state.xs[step], state.ys[step])
+            # subtract this tick's work from the next delay to hold the frame rate
+            work_ms = (time.perf_counter() - now) * 1000
+            self._schedule_next_frame(max(1, int(self._anim_frame_interval_ms - work_ms)))
             return
 
-        # finished: commit the move to board (use DisplayBoard.push to bypass override)
-        move = self._anim_data.get("move")
-        try:
-            DisplayBoard.push(self, move)
-        except Exception:
-            try:
-                super().push(move)
-            except Exception:
-                pass
-
-        # clear animation state
+        # finished: clear animation state first so the commit's redraw shows the final position
         self._animating = False
         self._anim_data = None
-        self._anim_after_id = None
+        self._delete_anim_item(state)
 
-        # final redraw of committed state
-        try:
-            self.redraw()
-        except Exception:
-            pass
+        # commit the move to board, then go on with the next queued one
+        self._commit_move(state.move)
+        self._drain_queue()
+
+    def _drain_queue(self):
+        """Start animating the next queued move; moves that are not animated are pushed straight away."""
+        queue = self._move_queue
+        while queue and not self._animating:
+            self._start_move_animation(queue.popleft())
 
     # --------------------
     # Draw override to render animated piece on top
     # --------------------
     @override
-    def _draw_pieces(self):
-        """Draw all pieces on the board using Unicode symbols."""
-        for r in range(8):
-            for c in range(8):
-                square = chess.square(c, 7 - r)
-                piece = self.piece_at(square)
-                # skip drawing the piece currently being dragged at its origin square
-                if piece == self._dragging_piece and square == self._selected_square:
-                    continue
-                if self._anim_data:
-                    if square == self._anim_data["from_square"]:continue
-                if piece:
-                    symbol = DisplayBoard.UNICODE_PIECES[piece.symbol()]
-                    draw_r, draw_c = r, c
-                    if self.flipped:
-                        draw_r, draw_c = 7 - r, 7 - c
-                    x_center = draw_c * self.square_size + self.square_size // 2
-                    y_center = draw_r * self.square_size + self.square_size // 2
-                    self.canvas.create_text(x_center, y_center, text=symbol, font=self.font, fill="black")
+    def _hidden_mask(self) -> chess.Bitboard:
+        """Also hide the animated piece at its origin square."""
+        mask = super()._hidden_mask()
+        if self._anim_data is not None:
+            mask |= chess.BB_SQUARES[self._anim_data.from_square]
+        return mask
 
     @override
-    def redraw(self):
-        """Render board then draw moving piece (if animating)."""
-        # parent draws board/pieces/overlays
-        super().redraw()
+    def _visible_state(self) -> _VisibleState:
+        """Include the square whose piece is hidden while it animates."""
+        anim_from = self._anim_data.from_square if self._anim_data else None
+        return super()._visible_state()._replace(anim_from=anim_from)
 
-        if not self._animating or not self._anim_data:
-            return
-
-        ad = self._anim_data
-        frm = ad["from_square"]
-        to = ad["to_square"]
-        frame = ad["frame"]
-        frames = ad["frames"]
-        symbol = ad["piece_symbol"]
-
-        # compute centers
-        cx_from, cy_from = self.square_center(frm)
-        cx_to, cy_to = self.square_center(to)
-
-        # Normalise t in [0,1]. Use frames-1 so final frame lands exactly on dest.
-        t = min(1.0, max(0.0, frame / max(1, frames - 1))) if frames > 1 else 1.0
-        t_eased = self._ease_out_quad(t)
-
-        cur_x = cx_from + (cx_to - cx_from) * t_eased
-        cur_y = cy_from + (cy_to - cy_from) * t_eased
-
-        # draw moving piece on top
-        self.canvas.create_text(int(cur_x), int(cur_y), text=symbol, font=self.font, fill="black")
+    @override
+    def redraw(self, force: bool = False):
+        """Render board and keep the moving piece (if animating) on top."""
+        # parent draws board/pieces/overlays
+        super().redraw(force)
+        if self._anim_data is not None and self._anim_data.item_id is not None:
+            self.canvas.tag_raise(self._anim_data.item_id)
 
     # --------------------
     # Logic / safety overrides
     # --------------------
     @override
     def push(self, move: chess.Move,animate: bool = True) -> None:
-        """Stop any running animation then start animating this push (or execute immediately if disabled)."""
-        # stop existing animation and commit its move
-        self.stop_animation()
+        """Animate this push once the running animation (if any) is done, or execute immediately if disabled.
 
-        # If animations disabled -> immediate
+        A queued or animating move is only pushed onto the board when its animation
+        finishes (or stop_animation() is called), so fen(), turn and legal_moves do
+        not reflect it until then.
+        """
+        # If animations disabled -> commit pending moves, then immediate
         if not self.allow_animation or not animate:
+            self.stop_animation()
             return DisplayBoard.push(self, move)
 
-        # start this animation (kills any previous).
+        # queue behind the current animation instead of cutting it short
+        if self._animating:
+            self._move_queue.append(move)
+            return None
 
         self._start_move_animation(move)
         return None
@@ -969,6 +1515,17 @@ class AnimatedDisplayBoard(DisplayBoard):
         self.stop_animation()
         return DisplayBoard.flip_board(self)
 
+    @override
+    def set_fen(self, fen: str):
+        # moves still animating or queued belong to the old position
+        self._discard_animation()
+        return DisplayBoard.set_fen(self, fen)
+
+    @override
+    def _board_modified(self):
+        self._discard_animation()
+        return DisplayBoard._board_modified(self)
+
     # --------------------
     # Event handler overrides (stop anim then delegate)
     # --------------------
@@ -995,8 +1552,9 @@ class AnimatedDisplayBoard(DisplayBoard):
             if self.make_move(self._selected_square, to_square,animate=False):
                 self._selected_square = None
         self._dragging_piece = None
+        self._hide_drag_piece()
         self._show_selected()
-        self.redraw()
+        self._schedule_redraw()
     # Ensure make_move uses animated push path
 
     @override
@@ -1005,16 +1563,16 @@ class AnimatedDisplayBoard(DisplayBoard):
         if from_square is None or to_square is None:
             return None
 
-        # promotion handling (delegate to parent semantics)
+        # promotion handling (same as parent: a legal queen promotion means all four are legal)
+        candidates = self._get_legal_by_from().get(from_square, ())
         if promo_piece is None and self._is_promotion(from_square, to_square) and \
-                any(chess.Move(from_square, to_square, p) in self.legal_moves
-                    for p in (chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT)):
+                chess.Move(from_square, to_square, chess.QUEEN) in candidates:
             self._waiting_move = chess.Move(from_square, to_square)
             self._promotion_active = True
             return None
 
         move = chess.Move(from_square, to_square, promotion=promo_piece)
-        if move in self.legal_moves:
+        if move in candidates:
             # push will handle animation
             self.push(move,animate)
             if callback: